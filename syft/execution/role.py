@@ -34,7 +34,7 @@ class Role(SyftSerializable):
         input_placeholder_ids: Tuple[int, str] = None,
         output_placeholder_ids: Tuple[int, str] = None,
     ):
-        self.id = id or sy.ID_PROVIDER.pop()
+        self.id = id if id is not None else sy.ID_PROVIDER.pop()
         self.worker = worker or sy.local_worker
 
         self.actions = actions or []
@@ -1,3 +1,10 @@
-from phe.paillier import generate_paillier_keypair
+def keygen(*args, **kwargs):
+    """Generates a Paillier public and private key pair.
 
-keygen = generate_paillier_keypair
+    phe is only imported when keys are first generated, so that importing syft
+    does not pay for it. See phe.paillier.generate_paillier_keypair for the
+    arguments.
+    """
+    from phe.paillier import generate_paillier_keypair
+
+    return generate_paillier_keypair(*args, **kwargs)
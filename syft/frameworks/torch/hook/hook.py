@@ -293,13 +293,13 @@ class TorchHook(FrameworkHook):
             setattr(Torch, attr, new_method)
 
     def _get_hooked_base_worker_method(hook_self, attr):
+        # Built once here so that calls don't format the command name
+        cmd_name = f"torch.{attr}"
+
         @wraps(attr)
         def overloaded_attr(self_torch, *args, **kwargs):
             ptr = hook_self.local_worker.send_command(
-                recipient=self_torch.worker(),
-                cmd_name=f"{'torch'}.{attr}",
-                args_=args,
-                kwargs_=kwargs,
+                recipient=self_torch.worker(), cmd_name=cmd_name, args_=args, kwargs_=kwargs,
             )
 
             return ptr.wrap()
@@ -314,9 +314,10 @@ class TorchHook(FrameworkHook):
         """
 
         tensor_type = self.torch.Tensor
+        additive_shared_attrs = set(dir(AdditiveSharingTensor))
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(AdditiveSharingTensor):
+            if attr not in additive_shared_attrs:
                 new_method = self._get_hooked_additive_shared_method(attr)
                 setattr(AdditiveSharingTensor, attr, new_method)
 
@@ -470,7 +471,7 @@ class TorchHook(FrameworkHook):
                     continue
 
                 # If we haven't already overloaded this function
-                if "native_" in func or f"native_{func}" in dir(torch_module):
+                if "native_" in func or hasattr(torch_module, f"native_{func}"):
                     continue
 
                 self._perform_function_overloading(module_name, torch_module, func)
@@ -486,7 +487,7 @@ class TorchHook(FrameworkHook):
         """
 
         def dispatch(args_, k):
-            return map(lambda x: x[k] if isinstance(x, dict) else x, args_)
+            return [x[k] if isinstance(x, dict) else x for x in args_]
 
         @wraps(attr)
         def overloaded_attr(self, *args, **kwargs):
@@ -499,9 +500,15 @@ class TorchHook(FrameworkHook):
                 attr, self, args, kwargs
             )
 
+            # Only rebuild the args for each share if some of them are split in shares
+            if any(isinstance(x, dict) for x in new_args):
+                share_args = lambda k: dispatch(new_args, k)
+            else:
+                share_args = lambda k: new_args
+
             results = {}
             for k, v in new_self.items():
-                results[k] = v.__getattribute__(attr)(*dispatch(new_args, k), **new_kwargs)
+                results[k] = v.__getattribute__(attr)(*share_args(k), **new_kwargs)
 
             # Put back AdditiveSharingTensor on the tensors found in the response
             response = hook_args.hook_response(
@@ -523,14 +530,18 @@ class TorchHook(FrameworkHook):
             hook_self: the hook itself
         """
 
-        if "native_tensor" not in dir(hook_self.torch):
+        if not hasattr(hook_self.torch, "native_tensor"):
             hook_self.torch.native_tensor = hook_self.torch.tensor
 
+        # Resolve the native constructor once at hooking time rather than
+        # looking it up on the torch module for every tensor built
+        native_tensor = hook_self.torch.native_tensor
+
         def new_tensor(*args, owner=None, id=None, register=True, **kwargs):
-            current_tensor = hook_self.torch.native_tensor(*args, **kwargs)
-            _apply_args(hook_self, current_tensor, owner, id)
+            current_tensor = native_tensor(*args, **kwargs)
+            owner = _apply_args(hook_self, current_tensor, owner, id)
             if register:
-                current_tensor.owner.register_obj(current_tensor)
+                owner.register_obj(current_tensor)
 
             return current_tensor
 
@@ -354,12 +354,14 @@ class TorchTensor(AbstractTensor):
         except PureFrameworkTensorFoundError:  # means that it's not a wrapper but a pure tensor
 
             # Check that the function has not been overwritten
-            try:
-                # Try to get recursively the attributes in cmd = "<attr1>.<attr2>.<attr3>..."
-                command = cls.rgetattr(cls, cmd)
-                return command(*args_, **kwargs_)
-            except AttributeError:
-                pass
+            overloaded_func = cls._get_overloaded_func(cmd)
+            if overloaded_func is not None:
+                try:
+                    return overloaded_func(*args_, **kwargs_)
+                except AttributeError:
+                    # The overload doesn't support these args (ex: int shifts for
+                    # roll), so fall back on the native function
+                    pass
 
             # Run the native function with the new args
             # Note the the cmd should already be checked upon reception by the worker
@@ -373,6 +375,17 @@ class TorchTensor(AbstractTensor):
 
         return response
 
+    @staticmethod
+    @memorize
+    def _get_overloaded_func(cmd):
+        """
+        Return the function overwriting cmd in TorchTensor.torch, or None if
+        the native function should be used. The lookup is cached as it is
+        performed for every function called on pure tensors.
+        """
+        # Get recursively the attributes in cmd = "<attr1>.<attr2>.<attr3>..."
+        return TorchTensor.rgetattr(TorchTensor, cmd, None)
+
     @staticmethod
     @memorize
     def _get_method(cmd):
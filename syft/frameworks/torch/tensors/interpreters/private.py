@@ -37,7 +37,7 @@ class PrivateTensor(AbstractTensor):
         """
         super().__init__(tags=tags, description=description)
         self.owner = owner
-        self.id = id if id else syft.ID_PROVIDER.pop()
+        self.id = id if id is not None else syft.ID_PROVIDER.pop()
         self.child = None
         self.allowed_users = allowed_users
         self.parents = parents
@@ -34,12 +34,15 @@ def hookable(hookable_method):
     This function should be used only as a decorator.
     """
     method_name = hookable_method.__name__
+    # The hook names are fixed, so build them once here rather than on each call
+    before_method_name = f"_before_{method_name}"
+    after_method_name = f"_after_{method_name}"
 
     @wraps(hookable_method)
     def hooked_method(self, *args, **kwargs):
-        map_chain_call(self, f"_before_{method_name}", *args, **kwargs)
+        map_chain_call(self, before_method_name, *args, **kwargs)
         return_val = hookable_method(self, *args, **kwargs)
-        return_val = reduce_chain_call(self, f"_after_{method_name}", return_val, *args, **kwargs)
+        return_val = reduce_chain_call(self, after_method_name, return_val, *args, **kwargs)
         return return_val
 
     return hooked_method
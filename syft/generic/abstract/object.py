@@ -4,6 +4,7 @@ from typing import Set
 
 import syft as sy
 from syft.generic.frameworks.hook import hook_args
+from syft.generic.utils import memorize
 
 
 class AbstractObject(ABC):
@@ -35,7 +36,7 @@ class AbstractObject(ABC):
                 a chain of tensors
         """
         self.owner = owner or sy.local_worker
-        self.id = id or sy.ID_PROVIDER.pop()
+        self.id = id if id is not None else sy.ID_PROVIDER.pop()
         self.tags = tags or set()
         self.description = description
         self.child = child
@@ -152,7 +153,16 @@ class AbstractObject(ABC):
         def _getattr(obj, attr):
             return getattr(obj, attr, *args)
 
-        return functools.reduce(_getattr, [obj] + attr.split("."))
+        return functools.reduce(_getattr, _split_attr_path(attr), obj)
+
+
+@memorize
+def _split_attr_path(attr):
+    """
+    Split a nested attribute path like 'attr1.attr2.attr3'. There is one
+    path per hooked command, so the splits are cached.
+    """
+    return tuple(attr.split("."))
 
 
 def initialize_object(
@@ -189,3 +199,5 @@ def _apply_args(hook, obj_to_register, owner=None, id=None):
 
     obj_to_register.id = id
     obj_to_register.owner = owner
+
+    return owner
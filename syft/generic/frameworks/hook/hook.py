@@ -1,6 +1,7 @@
 from abc import ABC
 from abc import abstractmethod
 from functools import wraps
+import sys
 import types
 from typing import List
 
@@ -139,6 +140,11 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
             the hooked method
         """
 
+        # Name of the native method, built once rather than for each call
+        native_method_name = f"native_{method_name}"
+        # Whether the method is inplace is fixed, so decide it at hooking time
+        is_inplace_method = syft.framework.is_inplace_method(method_name)
+
         @wraps(getattr(tensor_type, method_name))
         def overloaded_native_method(self, *args, **kwargs):
             """
@@ -159,7 +165,7 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
                         args = [args[0]]
                         return overloaded_native_method(self, *args, **kwargs)
 
-                method = getattr(self, f"native_{method_name}")
+                method = getattr(self, native_method_name)
                 # Run the native function with the new args
 
                 try:
@@ -210,7 +216,7 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
                 response = method(*new_args, **new_kwargs)
 
                 # For inplace methods, just directly return self
-                if syft.framework.is_inplace_method(method_name):
+                if is_inplace_method:
                     return self
 
                 # Put back the wrappers where needed
@@ -241,13 +247,16 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
             the hooked method
         """
 
+        native_method_name = f"native_{method_name}"
+        is_inplace_method = syft.framework.is_inplace_method(method_name)
+
         @wraps(method_name)
         def overloaded_native_method(self, *args, **kwargs):
             """
             Operate the hooking
             """
             if not hasattr(self, "child"):  # means that it's not a wrapper
-                method = getattr(self, f"native_{method_name}")
+                method = getattr(self, native_method_name)
                 # Run the native function with the new args
 
                 try:
@@ -273,7 +282,7 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
                 response.parents = (self.id, new_self.id)
 
                 # For inplace methods, just directly return self
-                if syft.framework.is_inplace_method(method_name):
+                if is_inplace_method:
                     return self
 
                 # Put back the wrappers where needed
@@ -311,7 +320,13 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
             the hooked method
         """
 
-        cmd_name = f"{public_module_name}.{func_api_name}"
+        # Interned as it is used as a key in the command caches on every call
+        cmd_name = sys.intern(f"{public_module_name}.{func_api_name}")
+
+        # Functions are hooked for the current framework, so bind its tensor
+        # type and handler once instead of resolving syft.framework on each call
+        framework_tensor = syft.framework.Tensor
+        default_handle_func_command = framework_tensor.handle_func_command
 
         @wraps(func)
         def overloaded_func(*args, **kwargs):
@@ -324,14 +339,15 @@ class FrameworkHook(TensorHook, PointerHook, StringHook, ABC):
                     type(args[0]) if not isinstance(args[0], (tuple, list)) else type(args[0][0])
                 )
             except IndexError:
-                tensor_type = syft.framework.Tensor
+                tensor_type = framework_tensor
 
             command = (cmd_name, None, args, kwargs)
 
-            try:
-                handle_func_command = tensor_type.handle_func_command
-            except AttributeError:
-                handle_func_command = syft.framework.Tensor.handle_func_command
+            # Args like ints (ex: torch.zeros(3)) have no handle_func_command, so use
+            # a default rather than raising and catching an exception on each call
+            handle_func_command = getattr(tensor_type, "handle_func_command", None)
+            if handle_func_command is None:
+                handle_func_command = default_handle_func_command
 
             response = handle_func_command(command)
 
@@ -409,17 +409,14 @@ def build_get_tensor_type(rules, layer=None):
     lambdas = []
     for i, r in enumerate(rules):
         if r == 1:  # if a tensor is found
-            layer.append(i)
-            lambdas.append(
-                # the layer object is given to build a getter to reach the
-                # tensor position and then the type() is called on the obj found
-                lambda a: type(get_element_at[len(layer)](*layer)(a))
-            )
+            # the layer object is given to build once a getter to reach the
+            # tensor position and then the type() is called on the obj found
+            get_element = get_element_at[len(layer) + 1](*layer, i)
+            lambdas.append(lambda a: type(get_element(a)))
             # we only need one to get the type of all tensors as they should be the same
             break
         if isinstance(r, (list, tuple)):  # we iterate recursively if necessary
-            layer.append(i)
-            lambdas += build_get_tensor_type(r, layer)
+            lambdas += build_get_tensor_type(r, layer + [i])
 
     if first_layer:
         try:
@@ -439,15 +436,18 @@ def one_layer(idx1):
 
 
 def two_layers(idx1, idx2):
-    return lambda l: one_layer(idx2)(l[idx1])
+    get_next = one_layer(idx2)
+    return lambda l: get_next(l[idx1])
 
 
 def three_layers(idx1, *ids):
-    return lambda l: two_layers(*ids)(l[idx1])
+    get_next = two_layers(*ids)
+    return lambda l: get_next(l[idx1])
 
 
 def four_layers(idx1, *ids):
-    return lambda l: three_layers(*ids)(l[idx1])
+    get_next = three_layers(*ids)
+    return lambda l: get_next(l[idx1])
 
 
 get_element_at = {1: one_layer, 2: two_layers, 3: three_layers, 4: four_layers}
@@ -617,9 +617,11 @@ def typed_identity(a):
         return none_identity
 
     elif type(a) in (int, float, bool):
+        # Resolve the expected type once instead of at each call
+        number_type = type(a)
 
         def number_identity(i):
-            assert isinstance(i, type(a))
+            assert isinstance(i, number_type)
             return i
 
         return number_identity
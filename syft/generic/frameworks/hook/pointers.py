@@ -21,9 +21,11 @@ class PointerHook(ABC):
         is pointing at.
         """
 
+        pointer_attrs = set(dir(PointerTensor))
+
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(PointerTensor) or attr in self.boolean_comparators:
+            if attr not in pointer_attrs or attr in self.boolean_comparators:
                 new_method = self._get_hooked_pointer_method(attr)
                 setattr(PointerTensor, attr, new_method)
 
@@ -48,9 +50,11 @@ class PointerHook(ABC):
         location it is pointing at.
         """
 
+        multi_pointer_attrs = set(dir(MultiPointerTensor))
+
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(MultiPointerTensor):
+            if attr not in multi_pointer_attrs:
                 new_method = self._get_hooked_multi_pointer_method(attr)
                 setattr(MultiPointerTensor, attr, new_method)
 
@@ -65,6 +69,9 @@ class PointerHook(ABC):
             the hooked method
         """
 
+        # Whether the method is inplace is fixed, so decide it at hooking time
+        is_inplace_method = syft.framework.is_inplace_method(attr)
+
         @wraps(attr)
         def overloaded_pointer_method(self, *args, **kwargs):
             """
@@ -84,7 +91,7 @@ class PointerHook(ABC):
             response = owner.send_command(location, attr, self, args, kwargs)
 
             # For inplace methods, just directly return self
-            if syft.framework.is_inplace_method(attr):
+            if is_inplace_method:
                 return self
 
             return response
@@ -103,7 +110,7 @@ class PointerHook(ABC):
         """
 
         def dispatch(args_, k):
-            return map(lambda x: x[k] if isinstance(x, dict) else x, args_)
+            return [x[k] if isinstance(x, dict) else x for x in args_]
 
         @wraps(attr)
         def overloaded_attr(self, *args, **kwargs):
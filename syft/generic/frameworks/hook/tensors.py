@@ -33,7 +33,7 @@ class TensorHook(ABC):
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
             # if we haven't already overloaded this function
-            if f"native_{attr}" not in dir(tensor_type):
+            if not hasattr(tensor_type, f"native_{attr}"):
                 native_method = getattr(tensor_type, attr)
                 setattr(tensor_type, f"native_{attr}", native_method)
                 new_method = self._get_hooked_method(tensor_type, attr)
@@ -126,6 +126,8 @@ class TensorHook(ABC):
         to_overload = self.boolean_comparators.copy()
 
         native_pattern = re.compile("native*")
+        # Listing attributes is costly, so do it once rather than for each attr
+        object_attrs = set(dir(object))
 
         for attr in dir(tensor_type):
 
@@ -137,7 +139,7 @@ class TensorHook(ABC):
                 continue
 
             lit = getattr(tensor_type, attr)
-            is_base = attr in dir(object)
+            is_base = attr in object_attrs
             is_desc = inspect.ismethoddescriptor(lit)
             is_func = isinstance(lit, types.FunctionType)
             is_overloaded = native_pattern.match(attr) is not None
@@ -159,9 +161,11 @@ class TensorHook(ABC):
             syft_type: the syft_type which holds the methods
         """
 
+        syft_type_attrs = set(dir(syft_type))
+
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(syft_type):
+            if attr not in syft_type_attrs:
                 new_method = self._get_hooked_syft_method(attr)
                 setattr(syft_type, attr, new_method)
 
@@ -174,16 +178,19 @@ class TensorHook(ABC):
         def create_tracing_method(base_method, name):
             def tracing_method(self, *args, **kwargs):
                 response = base_method(self, *args, **kwargs)
-                command = (name, self, args, kwargs), response
+                # Only build the command when there is a role to record it
                 if self.tracing:
+                    command = (name, self, args, kwargs), response
                     self.role.register_action(command, syft.execution.computation.ComputationAction)
                 return response
 
             return tracing_method
 
+        syft_type_attrs = set(dir(syft_type))
+
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(syft_type) or attr in self.boolean_comparators:
+            if attr not in syft_type_attrs or attr in self.boolean_comparators:
                 new_method = create_tracing_method(self._get_hooked_syft_method(attr), attr)
                 setattr(syft_type, attr, new_method)
 
@@ -193,8 +200,10 @@ class TensorHook(ABC):
         Private Tensor: It'll add references to its parents and save
         command/actions history.
         """
+        syft_type_attrs = set(dir(syft_type))
+
         # Use a pre-defined list to select the methods to overload
         for attr in self.to_auto_overload[tensor_type]:
-            if attr not in dir(syft_type):
+            if attr not in syft_type_attrs:
                 new_method = self._get_hooked_private_method(attr)
                 setattr(syft_type, attr, new_method)
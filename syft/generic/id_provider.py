@@ -1,10 +1,26 @@
+import os
 import random
 from typing import List
 from syft import exceptions
 
 
+# Random ids are generated by batches and served from this buffer to amortize
+# the cost of drawing them one at a time, as an id is needed for every object
+ID_BATCH_SIZE = 4096
+_random_ids = []
+
+# A forked process (ex: syft.pool() or a worker process) would otherwise serve
+# the same ids as its parent. os.register_at_fork doesn't exist in Python 3.6.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random_ids.clear)
+
+
 def create_random_id():
-    return int(10e10 * random.random())
+    try:
+        return _random_ids.pop()
+    except IndexError:
+        _random_ids.extend(int(10e10 * random.random()) for _ in range(ID_BATCH_SIZE))
+        return _random_ids.pop()
 
 
 class IdProvider:
@@ -17,6 +33,8 @@ class IdProvider:
     An instance of IdProvider is accessible via sy.ID_PROVIDER.
     """
 
+    __slots__ = ("given_ids", "generated", "record_ids", "recorded_ids")
+
     def __init__(self, given_ids=None):
         self.given_ids = given_ids if given_ids is not None else []
         self.generated = set()
@@ -87,4 +105,10 @@ class IdProvider:
 
     @staticmethod
     def seed(seed=0):
+        """Seeds the generation of random ids.
+
+        Prefer this to random.seed(), as it also drops the ids drawn in advance
+        so that the next ids are reproducible.
+        """
         random.seed(seed)
+        _random_ids.clear()
@@ -113,8 +113,8 @@ class ObjectStore:
             # update tag index
             if obj.tags:
                 for tag in obj.tags:
-                    if tag not in self._tag_to_object_ids:
-                        self._tag_to_object_ids[tag].remove(obj.id)
+                    if tag in self._tag_to_object_ids:
+                        self._tag_to_object_ids[tag].discard(obj.id)
 
             if force and hasattr(obj, "child") and hasattr(obj.child, "garbage_collect_data"):
                 obj.child.garbage_collect_data = True
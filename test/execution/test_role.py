@@ -6,6 +6,12 @@ from syft.execution.computation import ComputationAction
 from syft.execution.communication import CommunicationAction
 
 
+def test_falsy_id_is_kept():
+    role = Role(id=0)
+
+    assert role.id == 0
+
+
 def test_register_computation_action():
     role = Role()
     placeholder = PlaceHolder()
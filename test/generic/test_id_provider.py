@@ -1,3 +1,5 @@
+import multiprocessing
+import os
 import unittest.mock as mock
 import pytest
 
@@ -146,3 +148,42 @@ def test_get_recorded_ids():
     assert len(ids) == 2
     assert ids[0] == initial_given_ids[-2]
     assert ids[1] == initial_given_ids[-3]
+
+
+def test_seed_gives_reproducible_ids():
+    provider = id_provider.IdProvider()
+
+    provider.seed(42)
+    first_ids = [provider.pop() for _ in range(3)]
+
+    provider = id_provider.IdProvider()
+    provider.seed(42)
+    second_ids = [provider.pop() for _ in range(3)]
+
+    assert first_ids == second_ids
+
+
+def _put_random_ids(queue):
+    queue.put([id_provider.create_random_id() for _ in range(3)])
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "register_at_fork"), reason="ids are not reset on fork before Python 3.7"
+)
+def test_forked_processes_get_distinct_ids():
+    # Make sure some ids are buffered before forking
+    id_provider.create_random_id()
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    processes = [context.Process(target=_put_random_ids, args=(queue,)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    children_ids = [queue.get(timeout=10) for _ in processes]
+    for process in processes:
+        process.join()
+
+    parent_ids = [id_provider.create_random_id() for _ in range(3)]
+
+    assert children_ids[0] != children_ids[1]
+    assert not set(parent_ids) & set(children_ids[0] + children_ids[1])
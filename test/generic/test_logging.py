@@ -18,6 +18,16 @@ def test_wrap():
     assert isinstance(x.child.child, torch.Tensor)
 
 
+def test_falsy_id_is_kept():
+    """
+    Test that an explicitly given id is not replaced, even if it is falsy
+    """
+
+    x = LoggingTensor(id=0)
+
+    assert x.id == 0
+
+
 def test_overwritten_method_on_log_chain():
     """
     Test method call on a chain including a log tensor
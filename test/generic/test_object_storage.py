@@ -39,3 +39,21 @@ def test_set_obj_takes_ownership(workers):
 
     assert objs[x.id] == x
     assert objs[x.id].owner == workers["me"]
+
+
+def test_rm_obj_updates_tag_index():
+    """
+    Checks that removing a tagged object also removes its id from the tag index
+    """
+    obj_storage = object_storage.ObjectStore()
+
+    x = torch.tensor(1)
+    x.tags = {"#x"}
+    obj_storage.set_obj(x)
+
+    assert obj_storage._tag_to_object_ids["#x"] == {x.id}
+
+    obj_storage.rm_obj(x.id)
+
+    assert obj_storage._tag_to_object_ids["#x"] == set()
+    assert obj_storage.find_by_tag("#x") == []
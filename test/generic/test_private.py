@@ -19,6 +19,14 @@ def test_wrap():
     assert isinstance(x.child.child, torch.Tensor)
 
 
+def test_falsy_id_is_kept():
+    """
+    Test that an explicitly given id is not replaced, even if it is falsy
+    """
+    x = PrivateTensor(id=0)
+    assert x.id == 0
+
+
 def test_native_private_tensor_method():
     """
     Test native's private_tensor method.
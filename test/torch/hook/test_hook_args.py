@@ -16,6 +16,13 @@ def test_build_rule_numpy():
     assert result == [1, 1, [0, 0, 0]]
 
 
+def test_build_get_tensor_type_after_tensorless_list():
+    x = torch.tensor([1, 2])
+    args_ = ([2, "string"], x)
+    get_tensor_type = hook_args.build_get_tensor_type(hook_args.build_rule(args_))
+    assert get_tensor_type(args_) == type(x)
+
+
 def test_list_as_index(workers):
     tensor = torch.tensor([10, 20, 30, -2, 3]).send(workers["bob"])
     target = torch.tensor([10, 20, 30, 3])